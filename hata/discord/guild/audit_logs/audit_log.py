@@ -1,5 +1,7 @@
 __all__ = ('AuditLog', )
 
+from operator import attrgetter
+
 from scarletio import WeakReferer
 
 from ...channel import Channel
@@ -11,6 +13,14 @@ from ...webhook import Webhook
 from .audit_log_entry import AuditLogEntry
 
 
+AUDIT_LOG_ENTITIES_GETTER = attrgetter('integrations', 'scheduled_events', 'threads', 'users', 'webhooks')
+
+"""
+AUDIT_LOG_ENTITIES_GETTER : `attrgetter`
+    Returns the entity dictionaries of an audit log.
+"""
+
+
 class AuditLog:
     """
     Whenever an admin action is performed on the API, an audit log entry is added to the respective guild's audit
@@ -88,7 +98,22 @@ class AuditLog:
         if not entry_datas:
             return False
         
+        self._populate_entities(data)
+        
+        self.entries.extend([AuditLogEntry(entry_data, self) for entry_data in entry_datas])
+        
+        return True
+    
+    
+    def _populate_entities(self, data):
+        """
+        Populates the audit log with the entities mentioned inside of the given data.
         
+        Parameters
+        ----------
+        data : `dict` (`str`, `Any`) items
+            Audit log data.
+        """
         try:
             users_data = data['users']
         except KeyError:
@@ -97,8 +122,9 @@ class AuditLog:
             users = self.users
             
             for user_data in users_data:
-                user = User.from_data(user_data)
-                users[user.id] = user
+                user_id = int(user_data['id'])
+                if user_id not in users:
+                    users[user_id] = User.from_data(user_data)
         
         
         try:
@@ -109,8 +135,9 @@ class AuditLog:
             webhooks = self.webhooks
             
             for webhook_data in webhooks_data:
-                webhook = Webhook(webhook_data)
-                webhooks[webhook.id] = webhook
+                webhook_id = int(webhook_data['id'])
+                if webhook_id not in webhooks:
+                    webhooks[webhook_id] = Webhook(webhook_data)
         
         
         try:
@@ -121,8 +148,9 @@ class AuditLog:
             integrations = self.integrations
             
             for integration_data in integration_datas:
-                integration = Integration(integration_data)
-                integrations[integration.id] = integration
+                integration_id = int(integration_data['id'])
+                if integration_id not in integrations:
+                    integrations[integration_id] = Integration(integration_data)
         
         
         try:
@@ -131,10 +159,12 @@ class AuditLog:
             pass
         else:
             threads = self.threads
+            guild_id = self.guild.id
             
             for thread_data in thread_datas:
-                thread = Channel(thread_data, None, self.guild.id)
-                threads[thread.id] = thread
+                thread_id = int(thread_data['id'])
+                if thread_id not in threads:
+                    threads[thread_id] = Channel(thread_data, None, guild_id)
         
         
         try:
@@ -145,15 +175,25 @@ class AuditLog:
             scheduled_events = self.scheduled_events
             
             for scheduled_event_data in scheduled_event_datas:
-                scheduled_event = ScheduledEvent(scheduled_event_data)
-                scheduled_events[scheduled_event.id] = scheduled_event
-        
-        
-        entries = self.entries
-        for entry_data in entry_datas:
-            entries.append(AuditLogEntry(entry_data, self))
+                scheduled_event_id = int(scheduled_event_data['id'])
+                if scheduled_event_id not in scheduled_events:
+                    scheduled_events[scheduled_event_id] = ScheduledEvent(scheduled_event_data)
+    
+    
+    def _link_entities(self, audit_log):
+        """
+        Links the entities of the given audit log to self, which are not yet present.
         
-        return True
+        Parameters
+        ----------
+        audit_log : ``AuditLog``
+            The audit log to take the entities from.
+        """
+        for self_entities, other_entities in zip(
+            AUDIT_LOG_ENTITIES_GETTER(self), AUDIT_LOG_ENTITIES_GETTER(audit_log)
+        ):
+            for entity_id, entity in other_entities.items():
+                self_entities.setdefault(entity_id, entity)
     
     
     def _get_self_reference(self):
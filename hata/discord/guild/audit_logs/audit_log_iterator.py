@@ -1,6 +1,13 @@
 __all__ = ('AuditLogIterator', )
 
+from collections import OrderedDict
+from itertools import islice
+from operator import attrgetter, length_hint
+
+from scarletio import LOOP_TIME, Task
+
 from ...bases import maybe_snowflake
+from ...core import KOKORO
 from ...user import ClientUserBase
 from ...utils import now_as_id
 
@@ -12,6 +19,36 @@ from .audit_log_entry import AuditLogEntry
 from .preinstanced import AuditLogEvent
 
 
+AUDIT_LOG_ATTRIBUTE_GETTER = attrgetter(
+    'entries', 'guild', 'integrations', 'scheduled_events', 'threads', 'users', 'webhooks'
+)
+
+AUDIT_LOG_CHUNK_CACHE = OrderedDict()
+AUDIT_LOG_CHUNK_CACHE_SIZE = 16
+AUDIT_LOG_CHUNK_CACHE_TIMEOUT = 60.0
+AUDIT_LOG_PREFETCH_THRESHOLD = 10
+
+"""
+AUDIT_LOG_CHUNK_CACHE : `OrderedDict` of (`tuple` (`int`, `int`, `int`, `int`, `int`), `tuple` (`float`, `tuple`)) items
+    Recently requested audit log chunks. The keys are `(client_id, guild_id, before, user_id, action_type)` tuples,
+    meanwhile the values are `(requested_at, chunk)` pairs. The least recently used chunk is the first.
+    
+    The entries before an audit log entry do not change, so a chunk can be reused by separate iterators of the same
+    client with the same filters. Chunks are never shared between clients, since their access to the audit logs can
+    differ.
+    
+    The entities mentioned by a chunk are stored as the already built objects. The entity data inside of the chunk
+    can get outdated, so it is never processed again.
+AUDIT_LOG_CHUNK_CACHE_SIZE : `int` = `16`
+    The maximal amount of chunks stored in ``AUDIT_LOG_CHUNK_CACHE``.
+AUDIT_LOG_CHUNK_CACHE_TIMEOUT : `float` = `60.0`
+    After how much seconds a cached chunk is requested again.
+AUDIT_LOG_PREFETCH_THRESHOLD : `int` = `10`
+    When iterating entry by entry, the next audit log chunk is requested in the background, when this many or less
+    loaded entries are left.
+"""
+
+
 class AuditLogIterator(AuditLog):
     """
     An async iterator over a guild's audit logs.
@@ -38,15 +75,28 @@ class AuditLogIterator(AuditLog):
         A dictionary what contains the mentioned webhook by the audit log's entries. The keys are the `id`-s of the
         webhooks, meanwhile the values are the values themselves.
     
+    _exhausted : `bool`
+        Whether all the audit log entries are loaded. Set when an empty or a not full chunk is received.
     _data : `dict` of (`str`, `Any`) items
         Data to be sent to Discord when requesting an another audit log chunk. Contains some information, which are not
         stored by any attributes of the audit log iterator, these are the filtering `user` and `event` options.
-    _index : `int`
-        The next audit log entries index to yield.
+        
+        Used as a template: it is never mutated after creation, each request extends a new dictionary from it with
+        the respective `before` value.
+    _fetch : `callable` (`awaitable`)
+        The client's http client's bound `audit_log_get_chunk` method to request a chunk with.
+    _guild_id : `int`
+        The respective guild's identifier.
+    _iterator : `iterator`
+        Iterator yielding the next audit log entries.
+    _prefetch_before : `int`
+        The `before` value, which was used to start ``._prefetch_task``.
+    _prefetch_task : `None`, ``Task``
+        Task requesting the next audit log chunk in the background.
     client : ``Client``
         The client, who will execute the api requests.
     """
-    __slots__ = ('_data', '_index', 'client',)
+    __slots__ = ('_data', '_exhausted', '_fetch', '_guild_id', '_iterator', '_prefetch_before', '_prefetch_task', 'client',)
     
     async def __new__(cls, client, guild, user=None, event=None):
         """
@@ -120,8 +170,10 @@ class AuditLogIterator(AuditLog):
             
             data['action_type'] = event_value
         
+        fetch = client.http.audit_log_get_chunk
+        
         if guild is None:
-            log_data = await client.http.audit_log_get_chunk(guild_id, data)
+            log_data = await fetch(guild_id, data)
             if guild is None:
                 guild = create_partial_guild_from_id(guild_id)
         else:
@@ -129,11 +181,16 @@ class AuditLogIterator(AuditLog):
         
         self = AuditLog.__new__(cls, data, guild)
         self._data = data
-        self._index = 0
+        self._exhausted = False
+        self._fetch = fetch
+        self._guild_id = guild_id
+        self._iterator = iter(self.entries)
+        self._prefetch_before = 0
+        self._prefetch_task = None
         self.client = client
         
         if (log_data is not None):
-            self._populate(log_data)
+            self._populate_chunk(self._create_chunk(log_data))
         
         return self
     
@@ -142,26 +199,215 @@ class AuditLogIterator(AuditLog):
         """
         Loads all not yet loaded audit logs of the audit log iterator's guild.
         
+        When a full chunk is received, the next one is requested right away, so it is in flight meanwhile the current
+        one is processed.
+        
         This method is a coroutine.
         """
+        while not self._exhausted:
+            chunk = await self._fetch_next_chunk()
+            
+            entry_datas = chunk[0]
+            if (entry_datas is not None) and (len(entry_datas) == 100):
+                self._start_prefetch(int(entry_datas[-1]['id']))
+            
+            self._populate_chunk(chunk)
+    
+    
+    async def pages(self):
+        """
+        Iterates over the audit log iterator's entries chunk by chunk, requesting the not yet loaded chunks as
+        required.
+        
+        Prefer this over entry by entry iteration when bulk processing entries, since it suspends only once per chunk.
+        
+        This method is an async generator.
+        
+        Yields
+        ------
+        page : `list` of ``AuditLogEntry``
+            Up to `100` audit log entries.
+        """
         entries = self.entries
-        client = self.client
-        http = client.http
-        data = self._data
+        index = 0
         
         while True:
-            if entries:
-                data['before'] = entries[-1].id
-            
-            log_data = await http.audit_log_get_chunk(self.guild.id, data)
+            ln = len(entries)
+            if index < ln:
+                end = index + 100
+                if end == ln:
+                    self._start_prefetch(entries[-1].id)
+                
+                page = entries[index:end]
+                index = end
+                yield page
+                continue
             
-            if not self._populate(log_data):
+            if self._exhausted:
                 return
             
-            if len(entries) % 100:
+            chunk = await self._fetch_next_chunk()
+            
+            if not self._populate_chunk(chunk):
                 return
     
     
+    def _create_chunk(self, log_data):
+        """
+        Creates an audit log chunk from the given audit log data by building the entities mentioned inside of it.
+        
+        Parameters
+        ----------
+        log_data : `dict` of (`str`, `Any`) items
+            Audit log data.
+        
+        Returns
+        -------
+        chunk : `tuple` (`None`, `list` of (`dict` of (`str`, `Any`) items), ``AuditLog``)
+            The chunk's entry data and an audit log containing only the entities mentioned by the chunk.
+        """
+        entities = AuditLog.__new__(AuditLog, None, self.guild)
+        entities._populate_entities(log_data)
+        return log_data.get('audit_log_entries', None), entities
+    
+    
+    def _populate_chunk(self, chunk):
+        """
+        Populates the audit log iterator with the given audit log chunk and marks it as exhausted if it is the last one.
+        
+        The chunk's entities are only linked, so a cached chunk does not update them with its outdated data.
+        
+        Parameters
+        ----------
+        chunk : `tuple` (`None`, `list` of (`dict` of (`str`, `Any`) items), ``AuditLog``)
+            The chunk's entry data and an audit log containing the entities mentioned by the chunk.
+        
+        Returns
+        -------
+        populated : `bool`
+            Whether any entry was added to the audit log iterator.
+        """
+        entry_datas, entities = chunk
+        if not entry_datas:
+            self._exhausted = True
+            return False
+        
+        self._link_entities(entities)
+        self.entries.extend([AuditLogEntry(entry_data, self) for entry_data in entry_datas])
+        
+        if len(entry_datas) < 100:
+            self._exhausted = True
+        
+        return True
+    
+    
+    async def _request_chunk(self, before):
+        """
+        Requests an audit log chunk of the audit log iterator's guild. If the same chunk was requested recently by the
+        same client, returns it from cache instead.
+        
+        This method is a coroutine.
+        
+        Parameters
+        ----------
+        before : `int`
+            The entries before this snowflake are requested.
+        
+        Returns
+        -------
+        chunk : `tuple` (`None`, `list` of (`dict` of (`str`, `Any`) items), ``AuditLog``)
+            The chunk's entry data and an audit log containing the entities mentioned by the chunk.
+        """
+        data = self._data
+        key = (self.client.id, self._guild_id, before, data.get('user_id', 0), data.get('action_type', 0))
+        
+        try:
+            requested_at, chunk = AUDIT_LOG_CHUNK_CACHE[key]
+        except KeyError:
+            pass
+        else:
+            if LOOP_TIME() - requested_at < AUDIT_LOG_CHUNK_CACHE_TIMEOUT:
+                AUDIT_LOG_CHUNK_CACHE.move_to_end(key)
+                return chunk
+            
+            del AUDIT_LOG_CHUNK_CACHE[key]
+        
+        log_data = await self._fetch(self._guild_id, {**data, 'before': before})
+        chunk = self._create_chunk(log_data)
+        
+        AUDIT_LOG_CHUNK_CACHE[key] = (LOOP_TIME(), chunk)
+        if len(AUDIT_LOG_CHUNK_CACHE) > AUDIT_LOG_CHUNK_CACHE_SIZE:
+            AUDIT_LOG_CHUNK_CACHE.popitem(last=False)
+        
+        return chunk
+    
+    
+    @staticmethod
+    def invalidate_cache():
+        """
+        Clears the audit log chunks cached by audit log iterators.
+        """
+        AUDIT_LOG_CHUNK_CACHE.clear()
+    
+    
+    def _start_prefetch(self, before):
+        """
+        Starts requesting the audit log chunk before the given snowflake in the background if not yet requesting and
+        if there is anything left to request.
+        
+        Parameters
+        ----------
+        before : `int`
+            The entries before this snowflake are requested. Should be the last (loaded) entry's identifier.
+        """
+        if (self._prefetch_task is None) and (not self._exhausted):
+            self._prefetch_before = before
+            self._prefetch_task = Task(self._request_chunk(before), KOKORO)
+    
+    
+    async def _fetch_next_chunk(self):
+        """
+        Gets the audit log chunk after the last loaded entry. If it is already being prefetched, waits for that request
+        instead of starting a new one.
+        
+        This method is a coroutine.
+        
+        Returns
+        -------
+        chunk : `tuple` (`None`, `list` of (`dict` of (`str`, `Any`) items), ``AuditLog``)
+            The chunk's entry data and an audit log containing the entities mentioned by the chunk.
+        """
+        entries = self.entries
+        if entries:
+            before = entries[-1].id
+        else:
+            before = self._data['before']
+        
+        prefetch_task = self._prefetch_task
+        if (prefetch_task is not None):
+            self._prefetch_task = None
+            
+            if self._prefetch_before == before:
+                return await prefetch_task
+            
+            prefetch_task.cancel()
+        
+        return await self._request_chunk(before)
+    
+    
+    def close(self):
+        """
+        Cancels the in-flight audit log chunk prefetch, if there is any.
+        
+        A prefetch is started only when the iteration is close to the end of the loaded entries. If the iteration is
+        stopped after that point, call this method, so the background request is not left unawaited.
+        """
+        prefetch_task = self._prefetch_task
+        if (prefetch_task is not None):
+            self._prefetch_task = None
+            prefetch_task.cancel()
+    
+    
     def transform(self):
         """
         Converts the audit log iterator to an audit log object.
@@ -171,19 +417,24 @@ class AuditLogIterator(AuditLog):
         audit_log : ``AuditLog``
         """
         audit_log = object.__new__(AuditLog)
-        audit_log.entries = self.entries
-        audit_log.guild = self.guild
-        audit_log.integrations = self.integrations
-        audit_log.scheduled_events = self.scheduled_events
-        audit_log.threads = self.threads
-        audit_log.users = self.users
-        audit_log.webhooks = self.webhooks
+        audit_log._self_reference = None
+        (
+            audit_log.entries,
+            audit_log.guild,
+            audit_log.integrations,
+            audit_log.scheduled_events,
+            audit_log.threads,
+            audit_log.users,
+            audit_log.webhooks,
+        ) = AUDIT_LOG_ATTRIBUTE_GETTER(self)
         return audit_log
     
     
     def __aiter__(self):
-        """Returns self and resets the `.index`."""
-        self._index = 0
+        """
+        Returns self and restarts the iteration from the first entry.
+        """
+        self._iterator = iter(self.entries)
         return self
     
     
@@ -191,27 +442,37 @@ class AuditLogIterator(AuditLog):
         """
         Yields the next entry of the audit log iterator.
         
+        When only ``AUDIT_LOG_PREFETCH_THRESHOLD`` loaded entries are left, starts requesting the next audit log
+        chunk in the background.
+        
         This method is a coroutine.
         """
-        ln = len(self.entries)
-        index = self._index
-        
-        if index < ln:
-            self._index += 1
-            return self.entries[index]
+        iterator = self._iterator
+        try:
+            entry = next(iterator)
+        except StopIteration:
+            pass
+        else:
+            if length_hint(iterator) <= AUDIT_LOG_PREFETCH_THRESHOLD:
+                entries = self.entries
+                self._start_prefetch(entries[-1].id)
+            
+            return entry
         
-        if index % 100:
+        if self._exhausted:
             raise StopAsyncIteration
         
-        data = self._data
-        if ln:
-            data['before'] = self.entries[ln - 1].id
-        
-        log_data = await self.client.http.audit_log_get_chunk(self.guild.id, data)
+        entries = self.entries
+        ln = len(entries)
         
+        chunk = await self._fetch_next_chunk()
         
-        if not self._populate(log_data):
+        if not self._populate_chunk(chunk):
             raise StopAsyncIteration
         
-        self._index += 1
-        return self.entries[index]
+        # List iterators cannot be resumed after exhausted, so continue with a new one skipping the yielded entries.
+        # Keep it a list iterator, so it still sees the entries loaded later and can tell how much entries are left.
+        iterator = iter(entries)
+        next(islice(iterator, ln, ln), None)
+        self._iterator = iterator
+        return next(iterator)
@@ -18,6 +18,14 @@ from .helpers import apply_translation_into
 from .preinstanced import APPLICATION_COMMAND_CONTEXT_TARGET_TYPES, ApplicationCommandTargetType
 
 
+MISSING = object()
+
+"""
+MISSING : `object`
+    Sentinel returned by `dict.get` when a field is not present in a received payload, since `None` is a valid value
+    for most of them.
+"""
+
 
 def _debug_application_command_description(description):
     """
@@ -25,7 +33,7 @@ def _debug_application_command_description(description):
     
     Parameters
     ----------
-    description : `None, `str`
+    description : `None`, `str`
         The description to run checks on.
     
     Raises
@@ -51,6 +59,83 @@ def _debug_application_command_description(description):
             )
 
 
+def _debug_application_command_parameters(name, description, allow_by_default, options):
+    """
+    Runs debug only checks on the parameters of ``ApplicationCommand.__new__``.
+    
+    Parameters
+    ----------
+    name : `str`
+        The name to run checks on.
+    
+    description : `None`, `str`
+        The description to run checks on.
+    
+    allow_by_default : `None`, `bool`
+        The `allow_by_default` value to run checks on.
+    
+    options : `None`, (`list`, `tuple`) of ``ApplicationCommandOption``
+        The options to run checks on.
+    
+    Raises
+    ------
+    AssertionError
+        Any checks failed.
+    """
+    # allow_by_default
+    if (allow_by_default is not None):
+        if not isinstance(allow_by_default, bool):
+            raise AssertionError(
+                f'`allow_by_default` can be `bool`, got {allow_by_default.__class__.__name__}; '
+                f'{allow_by_default!r}.'
+            )
+    
+    # description
+    _debug_application_command_description(description)
+    
+    # name
+    if not isinstance(name, str):
+        raise AssertionError(
+            f'`name` can be `str`, got {name.__class__.__name__}; {name!r}.'
+        )
+    
+    name_length = len(name)
+    if (
+        name_length < APPLICATION_COMMAND_NAME_LENGTH_MIN or
+        name_length > APPLICATION_COMMAND_NAME_LENGTH_MAX
+    ):
+        raise AssertionError(
+            f'`name` length can be in range '
+            f'[{APPLICATION_COMMAND_NAME_LENGTH_MIN}:{APPLICATION_COMMAND_NAME_LENGTH_MAX}], got '
+            f'{name_length!r}; {name!r}.'
+        )
+    
+    if not is_valid_application_command_name(name):
+        raise AssertionError(
+            f'`name` contains an unexpected character, got {name!r}.'
+        )
+    
+    # options
+    if (options is not None):
+        if not isinstance(options, (tuple, list)):
+            raise AssertionError(
+                f'`options` can be `None`, (`list`, `tuple`) of `{ApplicationCommandOption.__name__}`, '
+                f'got {options.__class__.__name__}; {options!r}.')
+        
+        if len(options) > APPLICATION_COMMAND_OPTIONS_MAX:
+            raise AssertionError(
+                f'`options` length can be in range '
+                f'[0:{APPLICATION_COMMAND_OPTIONS_MAX}], got {len(options)!r}; {options!r}'
+            )
+        
+        for index, option in enumerate(options):
+            if not isinstance(option, ApplicationCommandOption):
+                raise AssertionError(
+                    f'`options[{index!r}]` is not `{ApplicationCommandOption.__name__}`, got '
+                    f'{option.__class__.__name__}; {option!r}; options={options!r}.'
+                )
+
+
 class ApplicationCommand(DiscordEntity, immortal=True):
     """
     Represents a Discord slash command.
@@ -170,6 +255,9 @@ class ApplicationCommand(DiscordEntity, immortal=True):
             - If `options`'s length is out of range [0:25].
             - If `allow_by_default` was not given as `bool`.
         """
+        if __debug__:
+            _debug_application_command_parameters(name, description, allow_by_default, options)
+        
         # id
         # Internal attribute
         
@@ -177,75 +265,23 @@ class ApplicationCommand(DiscordEntity, immortal=True):
         if (allow_by_default is None):
             allow_by_default = True
         
-        else:
-            if __debug__:
-                if not isinstance(allow_by_default, bool):
-                    raise AssertionError(
-                        f'`allow_by_default` can be `bool`, got {allow_by_default.__class__.__name__}; '
-                        f'{allow_by_default!r}.'
-                    )
-        
-        # description
-        if __debug__:
-            _debug_application_command_description(description)
-        
         # description_localizations
-        description_localizations = localized_dictionary_builder(description_localizations, 'description_localizations')
-        
-        # name
-        if __debug__:
-            if not isinstance(name, str):
-                raise AssertionError(
-                    f'`name` can be `str`, got {name.__class__.__name__}; {name!r}.'
-                )
-            
-            name_length = len(name)
-            if (
-                name_length < APPLICATION_COMMAND_NAME_LENGTH_MIN or
-                name_length > APPLICATION_COMMAND_NAME_LENGTH_MAX
-            ):
-                raise AssertionError(
-                    f'`name` length can be in range '
-                    f'[{APPLICATION_COMMAND_NAME_LENGTH_MIN}:{APPLICATION_COMMAND_NAME_LENGTH_MAX}], got '
-                    f'{name_length!r}; {name!r}.'
-                )
-            
-            if not is_valid_application_command_name(name):
-                raise AssertionError(
-                    f'`name` contains an unexpected character, got {name!r}.'
-                )
+        if (description_localizations is not None):
+            description_localizations = localized_dictionary_builder(
+                description_localizations, 'description_localizations'
+            )
         
         # name_localizations
-        name_localizations = localized_dictionary_builder(name_localizations, 'name_localizations')
+        if (name_localizations is not None):
+            name_localizations = localized_dictionary_builder(name_localizations, 'name_localizations')
         
         # options
         if options is None:
             options_processed = None
         else:
-            if __debug__:
-                if not isinstance(options, (tuple, list)):
-                    raise AssertionError(
-                        f'`options` can be `None`, (`list`, `tuple`) of `{ApplicationCommandOption.__name__}`, '
-                        f'got {options.__class__.__name__}; {options!r}.')
-            
             # Copy it
             options_processed = list(options)
-            if options_processed:
-                if __debug__:
-                    if len(options_processed) > APPLICATION_COMMAND_OPTIONS_MAX:
-                        raise AssertionError(
-                            f'`options` length can be in range '
-                            f'[0:{APPLICATION_COMMAND_OPTIONS_MAX}], got {len(options_processed)!r}; {options!r}'
-                        )
-                    
-                    for index, option in enumerate(options_processed):
-                        if not isinstance(option, ApplicationCommandOption):
-                            raise AssertionError(
-                                f'`options[{index!r}]` is not `{ApplicationCommandOption.__name__}`, got '
-                                f'{option.__class__.__name__}; {option!r}; options={options!r}.'
-                            )
-            
-            else:
+            if not options_processed:
                 options_processed = None
         
         # required_permissions
@@ -263,6 +299,8 @@ class ApplicationCommand(DiscordEntity, immortal=True):
         # target_type
         if target_type is None:
             target_type = ApplicationCommandTargetType.chat
+        elif isinstance(target_type, ApplicationCommandTargetType):
+            pass
         else:
             target_type = preconvert_preinstanced_type(target_type, 'target_type', ApplicationCommandTargetType)
         
@@ -425,86 +463,59 @@ class ApplicationCommand(DiscordEntity, immortal=True):
         # Do not update, cannot be changed
         
         # allow_by_default
-        try:
-            allow_by_default = data['default_permission']
-        except KeyError:
-            pass
-        else:
+        allow_by_default = data.get('default_permission', MISSING)
+        if (allow_by_default is not MISSING):
             self.allow_by_default = allow_by_default
         
         # application_id
         # Do not update, cannot be changed
         
         # description
-        try:
-            description = data['description']
-        except KeyError:
-            pass
-        else:
+        description = data.get('description', MISSING)
+        if (description is not MISSING):
             if (description is not None) and (not description):
                 description = None
             self.description = description
         
         # description_localizations
-        try:
-            description_localizations = data['description_localizations']
-        except KeyError:
-            pass
-        else:
+        description_localizations = data.get('description_localizations', MISSING)
+        if (description_localizations is not MISSING):
             self.description_localizations = build_locale_dictionary(description_localizations)
         
         # name
-        try:
-            name = data['name']
-        except KeyError:
-            pass
-        else:
+        name = data.get('name', MISSING)
+        if (name is not MISSING):
             self.name = name
         
         # name_localizations
-        try:
-            name_localizations = data['name_localizations']
-        except KeyError:
-            pass
-        else:
+        name_localizations = data.get('name_localizations', MISSING)
+        if (name_localizations is not MISSING):
             self.name_localizations = build_locale_dictionary(name_localizations)
         
         # options
-        try:
-            option_datas = data['options']
-        except KeyError:
-            pass
-        else:
+        option_datas = data.get('options', MISSING)
+        if (option_datas is not MISSING):
             if (option_datas is None) or (not option_datas):
                 options = None
             else:
-                options = [ApplicationCommandOption.from_data(option_data) for option_data in option_datas]
+                options = list(map(ApplicationCommandOption.from_data, option_datas))
             self.options = options
         
         # required_permissions
-        try:
-            required_permissions = data['default_member_permissions']
-        except KeyError:
-            pass
-        else:
+        required_permissions = data.get('default_member_permissions', MISSING)
+        if (required_permissions is not MISSING):
             if (required_permissions is not None):
                 required_permissions = Permission(required_permissions)
             self.required_permissions = required_permissions
         
         # target_type
-        try:
-            target_type = data['type']
-        except KeyError:
-            pass
-        else:
+        target_type = data.get('type', MISSING)
+        if (target_type is not MISSING):
             self.target_type = ApplicationCommandTargetType.get(target_type)
         
         # version
-        try:
-            version = data['version']
-        except KeyError:
-            pass
-        else:
+        version = data.get('version', MISSING)
+        if (version is not MISSING):
             if version is None:
                 version = 0
             else:
@@ -557,114 +568,96 @@ class ApplicationCommand(DiscordEntity, immortal=True):
         # Do not update, cannot be changed
         
         # allow_by_default
-        try:
-            allow_by_default = data['default_permission']
-        except KeyError:
-            pass
-        else:
-            if self.allow_by_default != self.allow_by_default:
-                old_attributes['allow_by_default'] = allow_by_default
+        allow_by_default = data.get('default_permission', MISSING)
+        if (allow_by_default is not MISSING):
+            old_allow_by_default = self.allow_by_default
+            if old_allow_by_default != allow_by_default:
+                old_attributes['allow_by_default'] = old_allow_by_default
                 self.allow_by_default = allow_by_default
         
         # application_id
         # Do not update, cannot be changed
         
         # description
-        try:
-            description = data['description']
-        except KeyError:
-            pass
-        else:
+        description = data.get('description', MISSING)
+        if (description is not MISSING):
             if (description is not None) and (not description):
                 description = None
-            if self.description != description:
-                old_attributes['description'] = self.description
+            old_description = self.description
+            if old_description != description:
+                old_attributes['description'] = old_description
                 self.description = description
         
         # description_localizations
-        try:
-            description_localizations = data['description_localizations']
-        except KeyError:
-            pass
-        else:
+        description_localizations = data.get('description_localizations', MISSING)
+        if (description_localizations is not MISSING):
             description_localizations = build_locale_dictionary(description_localizations)
-            if self.description_localizations != description_localizations:
-                old_attributes['description_localizations'] = self.description_localizations
+            old_description_localizations = self.description_localizations
+            if old_description_localizations != description_localizations:
+                old_attributes['description_localizations'] = old_description_localizations
                 self.description_localizations = description_localizations
         
         # name
-        try:
-            name = data['name']
-        except KeyError:
-            pass
-        else:
-            if self.name != name:
-                old_attributes['name'] = self.name
+        name = data.get('name', MISSING)
+        if (name is not MISSING):
+            old_name = self.name
+            if old_name != name:
+                old_attributes['name'] = old_name
                 self.name = name
         
         # name_localizations
-        try:
-            name_localizations = data['name_localizations']
-        except KeyError:
-            pass
-        else:
+        name_localizations = data.get('name_localizations', MISSING)
+        if (name_localizations is not MISSING):
             name_localizations = build_locale_dictionary(name_localizations)
-            if self.name_localizations != name_localizations:
-                old_attributes['name_localizations'] = self.name_localizations
+            old_name_localizations = self.name_localizations
+            if old_name_localizations != name_localizations:
+                old_attributes['name_localizations'] = old_name_localizations
                 self.name_localizations = name_localizations
         
         # options
-        try:
-            option_datas = data['options']
-        except KeyError:
-            pass
-        else:
+        option_datas = data.get('options', MISSING)
+        if (option_datas is not MISSING):
             if (option_datas is None) or (not option_datas):
                 options = None
             else:
-                options = [ApplicationCommandOption.from_data(option_data) for option_data in option_datas]
+                options = list(map(ApplicationCommandOption.from_data, option_datas))
             
-            if self.options != options:
-                old_attributes['options'] = self.options
+            old_options = self.options
+            if old_options != options:
+                old_attributes['options'] = old_options
                 self.options = options
         
         # required_permissions
-        try:
-            required_permissions = data['default_member_permissions']
-        except KeyError:
-            pass
-        else:
+        required_permissions = data.get('default_member_permissions', MISSING)
+        if (required_permissions is not MISSING):
             if (required_permissions is not None):
                 required_permissions = Permission(required_permissions)
             
-            if self.required_permissions != required_permissions:
-                old_attributes['required_permissions'] = self.required_permissions
+            old_required_permissions = self.required_permissions
+            if old_required_permissions != required_permissions:
+                old_attributes['required_permissions'] = old_required_permissions
                 self.required_permissions = required_permissions
         
         # target_type
-        try:
-            target_type = data['type']
-        except KeyError:
-            pass
-        else:
+        target_type = data.get('type', MISSING)
+        if (target_type is not MISSING):
             target_type = ApplicationCommandTargetType.get(target_type)
-            if (self.target_type is not target_type):
-                old_attributes['target_type'] = self.target_type
+            old_target_type = self.target_type
+            if (old_target_type is not target_type):
+                old_attributes['target_type'] = old_target_type
                 self.target_type = target_type
         
         # version
-        try:
-            version = data['version']
-        except KeyError:
-            pass
-        else:
+        version = data.get('version', MISSING)
+        if (version is not MISSING):
             if version is None:
                 version = 0
             else:
                 version = int(version)
             
-            if self.version != version:
-                old_attributes['version'] = self.version
+            old_version = self.version
+            if old_version != version:
+                old_attributes['version'] = old_version
                 self.version = version
         
         return old_attributes
@@ -678,50 +671,29 @@ class ApplicationCommand(DiscordEntity, immortal=True):
         -------
         data : `dict` of (`str`, `Any`) items
         """
-        data = {}
-        
-        # id
-        # Receive only
-        
-        # allow_by_default
-        # Always add this to data, so if we update the command with it, will be always updated.
-        data['default_permission'] = self.allow_by_default
-        
-        # application_id
-        # Receive only
-        
-        # description
-        description = self.description
-        if (description is not None):
-            data['description'] = description
-        
-        data['description_localizations'] = destroy_locale_dictionary(self.description_localizations)
-        
-        # guild_id
-        # Receive only
-        
-        # name
-        data['name'] = self.name
-        
-        # name_localizations
-        data['name_localizations'] = destroy_locale_dictionary(self.name_localizations)
-        
-        # options
         options = self.options
         if (options is None):
             option_datas = []
         else:
             option_datas = [option.to_data() for option in options]
-        data['options'] = option_datas
         
-        # required_permissions
-        data['default_member_permissions'] = self.required_permissions
+        # id, application_id, guild_id and version are receive only
+        data = {
+            # Always add `allow_by_default` to data, so if we update the command with it, will be always updated.
+            'default_permission': self.allow_by_default,
+            'description_localizations': destroy_locale_dictionary(self.description_localizations),
+            'name': self.name,
+            'name_localizations': destroy_locale_dictionary(self.name_localizations),
+            'options': option_datas,
+            'default_member_permissions': self.required_permissions,
+            'type': self.target_type.value,
+        }
         
-        # target_type
-        data['type'] = self.target_type.value
+        # description
+        description = self.description
+        if (description is not None):
+            data['description'] = description
         
-        # version
-        # Receive only
         return data
     
     
@@ -730,13 +702,14 @@ class ApplicationCommand(DiscordEntity, immortal=True):
         repr_parts = ['<', self.__class__.__name__]
         
         # if the application command is partial, mention that, else add  `.id` and `.application_id` fields.
-        if self.partial:
+        application_command_id = self.id
+        if application_command_id == 0:
             repr_parts.append(' (partial)')
         
         else:
             # id
             repr_parts.append(' id=')
-            repr_parts.append(repr(self.id))
+            repr_parts.append(repr(application_command_id))
             
             # application_id
             repr_parts.append(', application_id=')
@@ -785,21 +758,7 @@ class ApplicationCommand(DiscordEntity, immortal=True):
         options = self.options
         if (options is not None):
             repr_parts.append(', options=[')
-            
-            index = 0
-            limit = len(options)
-            
-            while True:
-                option = options[index]
-                index += 1
-                repr_parts.append(repr(option))
-                
-                if index == limit:
-                    break
-                
-                repr_parts.append(', ')
-                continue
-            
+            repr_parts.append(', '.join([repr(option) for option in options]))
             repr_parts.append(']')
         
         # name_localizations
@@ -940,6 +899,9 @@ class ApplicationCommand(DiscordEntity, immortal=True):
     
     def __eq__(self, other):
         """Returns whether the two application commands are equal."""
+        if self is other:
+            return True
+        
         if type(self) is not type(other):
             return NotImplemented
         
@@ -989,6 +951,9 @@ class ApplicationCommand(DiscordEntity, immortal=True):
     
     def __ne__(self, other):
         """Returns whether the two application commands are different."""
+        if self is other:
+            return False
+        
         if type(self) is not type(other):
             return NotImplemented
         
@@ -1140,31 +1105,28 @@ class ApplicationCommand(DiscordEntity, immortal=True):
     
     def __len__(self):
         """Returns the application command's length."""
-        length = 0
+        # name
+        length = len(self.name)
         
         # description
-        length += len(self.description)
+        description = self.description
+        if (description is not None):
+            length += len(description)
         
         # description_localizations
         description_localizations = self.description_localizations
         if (description_localizations is not None):
-            for value in description_localizations.values():
-                length += len(value)
-        
-        # name
-        length += len(self.name)
+            length += sum(map(len, description_localizations.values()))
         
         # name_localizations
         name_localizations = self.name_localizations
         if (name_localizations is not None):
-            for value in name_localizations.values():
-                length += len(value)
+            length += sum(map(len, name_localizations.values()))
         
         # options
         options = self.options
         if (options is not None):
-            for option in options:
-                length += len(option)
+            length += sum(map(len, options))
         
         return length
     